@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the API check scripts (test_fixed_system.py, test_health_endpoint.py)
+"""
+
+import atexit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# One pooled session so the checks reuse a keep-alive connection to the API;
+# a server that is still starting up (502/503/504) gets two quick retries,
+# after which the last response is returned so the status can be reported
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(max_retries=Retry(
+    total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+    raise_on_status=False)))
+atexit.register(SESSION.close)
+
+def response_json(response):
+    """Decode a response body straight from bytes, with orjson when it is installed"""
+    return _loads(response.content)
@@ -20,6 +20,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.shared.database import get_chroma_client, get_collection
 from services.shared.config import config
+from restore_chromadb import collection_dirs, dir_size, fast_copy
 
 class ChromaDBBackup:
     def __init__(self):
@@ -75,7 +76,7 @@ class ChromaDBBackup:
         sqlite_backup = self.backup_path / "chroma.sqlite3"
         
         if sqlite_source.exists():
-            shutil.copy2(sqlite_source, sqlite_backup)
+            fast_copy(sqlite_source, sqlite_backup)
             
             # Get database info
             conn = sqlite3.connect(sqlite_source)
@@ -108,11 +109,10 @@ class ChromaDBBackup:
         embedding_backup_dir.mkdir(exist_ok=True)
         
         # Copy all subdirectories (embedding collections)
-        for item in self.chroma_data_dir.iterdir():
-            if item.is_dir() and item.name != "__pycache__":
-                dest_dir = embedding_backup_dir / item.name
-                shutil.copytree(item, dest_dir, dirs_exist_ok=True)
-                print(f"   ✅ Backed up collection: {item.name}")
+        for item in collection_dirs(self.chroma_data_dir):
+            dest_dir = embedding_backup_dir / item.name
+            shutil.copytree(item.path, dest_dir, dirs_exist_ok=True, copy_function=fast_copy)
+            print(f"   ✅ Backed up collection: {item.name}")
         
         # Create embedding manifest
         embedding_manifest = {
@@ -124,7 +124,7 @@ class ChromaDBBackup:
         total_size = 0
         for collection_dir in embedding_backup_dir.iterdir():
             if collection_dir.is_dir():
-                collection_size = sum(f.stat().st_size for f in collection_dir.rglob('*') if f.is_file())
+                collection_size = dir_size(collection_dir)
                 total_size += collection_size
                 
                 embedding_manifest["collections"].append({
@@ -264,7 +264,7 @@ class ChromaDBBackup:
                     "name": item.name,
                     "path": item,
                     "created": datetime.fromtimestamp(item.stat().st_mtime),
-                    "size_mb": sum(f.stat().st_size for f in item.rglob('*') if f.is_file()) / (1024 * 1024)
+                    "size_mb": dir_size(item) / (1024 * 1024)
                 }
                 backups.append(backup_info)
         
@@ -13,7 +13,6 @@ sys.path.append('services/shared')
 try:
     import chromadb
     from chromadb.config import Settings
-    from sentence_transformers import SentenceTransformer
     print("✅ Required modules imported")
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -82,8 +81,9 @@ def load_demo_data_to_chromadb():
             collection = client.create_collection(name="documents")
             print("✅ Created new documents collection")
         
-        # Load embedding model
+        # Load embedding model (imported here so the torch stack only loads when needed)
         print("🔄 Loading embedding model...")
+        from sentence_transformers import SentenceTransformer
         embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         
         # Get demo data
@@ -93,7 +93,6 @@ def load_demo_data_to_chromadb():
         ids = []
         documents_text = []
         metadatas = []
-        embeddings = []
         
         for doc in demo_documents:
             ids.append(doc['id'])
@@ -103,10 +102,14 @@ def load_demo_data_to_chromadb():
                 'url': doc['url'],
                 'source_url': doc['url']
             })
-            
-            # Generate embedding
-            embedding = embedding_model.encode([doc['content']])[0].tolist()
-            embeddings.append(embedding)
+        
+        # Generate all embeddings in one batched forward pass
+        embeddings = embedding_model.encode(
+            documents_text,
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).tolist()
         
         # Add to ChromaDB
         print("💾 Adding demo documents to ChromaDB...")
@@ -6,6 +6,7 @@ Extract documents from enhanced_embeddings_cache.pkl
 import pickle
 import os
 import json
+import shutil
 from pathlib import Path
 import chromadb
 from chromadb.config import Settings
@@ -151,13 +152,11 @@ def replace_chromadb():
         # Create backup of current ChromaDB
         backup_path = Path(f"chroma_data_backup_before_cache_restore_{int(time.time())}")
         if Path("chroma_data").exists():
-            import shutil
             shutil.copytree("chroma_data", backup_path)
             print(f"💾 Created backup: {backup_path}")
         
         # Remove old ChromaDB
         if Path("chroma_data").exists():
-            import shutil
             shutil.rmtree("chroma_data")
             print("🗑️  Removed old ChromaDB")
         
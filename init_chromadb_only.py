@@ -5,6 +5,7 @@ Initialize ChromaDB only (without Pinecone)
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Remove Pinecone environment variables
@@ -17,12 +18,30 @@ sys.path.append('services/shared')
 
 try:
     import chromadb
+    import chromadb.errors
     from chromadb.config import Settings
     print("✅ ChromaDB imported successfully")
 except ImportError as e:
     print(f"❌ ChromaDB import error: {e}")
     sys.exit(1)
 
+# Errors get_collection raises for a missing collection, as in services/shared/database.py;
+# anything else (such as a locked database) must not be mistaken for a cue to create
+COLLECTION_NOT_FOUND_ERRORS = (ValueError,) + tuple(
+    getattr(chromadb.errors, name)
+    for name in ("NotFoundError", "InvalidCollectionException")
+    if hasattr(chromadb.errors, name)
+)
+
+def _ensure_collection(client, collection_name):
+    """Get a collection, creating it if it does not exist yet"""
+    try:
+        client.get_collection(name=collection_name)
+        print(f"✅ Collection {collection_name} already exists")
+    except COLLECTION_NOT_FOUND_ERRORS:
+        client.create_collection(name=collection_name)
+        print(f"✅ Created collection: {collection_name}")
+
 def init_chromadb():
     """Initialize ChromaDB with fresh collections"""
     print("🔄 Initializing ChromaDB...")
@@ -42,13 +61,8 @@ def init_chromadb():
         # Create collections
         collections = ["universities", "documents", "scrape_logs", "chat_sessions", "chat_messages", "feedback"]
         
-        for collection_name in collections:
-            try:
-                client.get_collection(name=collection_name)
-                print(f"✅ Collection {collection_name} already exists")
-            except:
-                client.create_collection(name=collection_name)
-                print(f"✅ Created collection: {collection_name}")
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            list(executor.map(lambda name: _ensure_collection(client, name), collections))
         
         print("🎉 ChromaDB initialization completed successfully!")
         return True
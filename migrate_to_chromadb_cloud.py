@@ -125,11 +125,13 @@ def migrate_to_chromadb_cloud():
                 # Get local collection
                 try:
                     local_collection = local_client.get_collection(name=collection_name)
-                    local_data = local_collection.get()
                     
-                    if not local_data.get('ids') or len(local_data['ids']) == 0:
+                    # count() is a single COUNT query; only fetch the records when there are some
+                    if local_collection.count() == 0:
                         print(f"⚠️  Collection {collection_name} is empty, skipping")
                         continue
+                    
+                    local_data = local_collection.get()
                         
                 except Exception as e:
                     print(f"⚠️  Could not get local collection {collection_name}: {e}")
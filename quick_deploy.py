@@ -12,11 +12,13 @@ from pathlib import Path
 
 def print_banner():
     """Print deployment banner"""
-    print("🚀 Enhanced GPU Chatbot - One-Click Deployment")
-    print("=" * 50)
-    print("This script will deploy your chatbot to Railway.app")
-    print("Cost: $0-5/month | Setup Time: 5-10 minutes")
-    print("=" * 50)
+    print("\n".join([
+        "🚀 Enhanced GPU Chatbot - One-Click Deployment",
+        "=" * 50,
+        "This script will deploy your chatbot to Railway.app",
+        "Cost: $0-5/month | Setup Time: 5-10 minutes",
+        "=" * 50,
+    ]))
 
 def run_command(command, description, check_output=False):
     """Run a command and handle errors"""
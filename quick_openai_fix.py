@@ -6,6 +6,7 @@ This script modifies the OpenAI RAG chatbot to use compatible embeddings
 
 import sys
 import os
+import shutil
 from pathlib import Path
 
 # Add project root to path
@@ -99,7 +100,6 @@ def create_backup():
         backup_file = Path("services/chat_service/openai_rag_chatbot_backup.py")
         
         if original_file.exists():
-            import shutil
             shutil.copy2(original_file, backup_file)
             print(f"✅ Backup created: {backup_file}")
             return True
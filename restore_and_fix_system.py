@@ -11,10 +11,22 @@ import os
 import sys
 import shutil
 import sqlite3
+import threading
+import time
 from pathlib import Path
 import json
 from datetime import datetime
 
+from restore_chromadb import safe_rmtree
+
+def _delete_tree(path):
+    """Delete an old chroma_data tree in the background, reporting if it has to be left behind"""
+    try:
+        safe_rmtree(path)
+    except OSError as e:
+        print(f"⚠️  Could not delete old ChromaDB data at {path}: {e}")
+        print("   Remove it manually once nothing is using it")
+
 def restore_chromadb_from_backup():
     """Restore ChromaDB from the most recent backup"""
     print("🔄 Restoring ChromaDB from backup...")
@@ -41,7 +53,10 @@ def restore_chromadb_from_backup():
     # Create new chroma_data directory
     target_dir = "chroma_data"
     if os.path.exists(target_dir):
-        shutil.rmtree(target_dir)
+        # Renaming is instant; the old tree is deleted in the background while we copy
+        trash_dir = f"{target_dir}.trash-{os.getpid()}-{int(time.time())}"
+        os.rename(target_dir, trash_dir)
+        threading.Thread(target=_delete_tree, args=(trash_dir,), daemon=False).start()
     
     # Copy backup to new location
     shutil.copytree(source_backup, target_dir)
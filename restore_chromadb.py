@@ -7,10 +7,252 @@ Restores ChromaDB from a backup created by backup_chromadb.py
 import os
 import sys
 import shutil
+import sqlite3
 import json
+import threading
+import time
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+
+# Block size used when streaming backup archive members to disk
+RESTORE_CHUNK_BYTES = int(os.environ.get("RESTORE_CHUNK_BYTES", 1 << 20))
+
+# Archives with less compressed data than this are extracted on a single thread
+RESTORE_PARALLEL_MIN_BYTES = int(os.environ.get("RESTORE_PARALLEL_MIN_BYTES", 256 << 20))
+
+# Files and directories are written under this suffix and renamed into place when complete
+PARTIAL_SUFFIX = ".new"
+
+# Replaced collection directories are renamed to this prefix and deleted in the background
+STALE_PREFIX = ".stale-"
+
+# One reusable copy buffer per thread, so extraction workers never share or reallocate
+_copy_buffers = threading.local()
+
+def _copy_buffer():
+    """This thread's RESTORE_CHUNK_BYTES scratch buffer"""
+    view = getattr(_copy_buffers, "view", None)
+    if view is None:
+        view = _copy_buffers.view = memoryview(bytearray(RESTORE_CHUNK_BYTES))
+    return view
+
+def _copy_stream(src, dst):
+    """Copy src to dst through the thread's reusable buffer"""
+    view = _copy_buffer()
+    while True:
+        n = src.readinto(view)
+        if not n:
+            break
+        dst.write(view[:n])
+
+def _member_parts(info):
+    """Path components of an archive member, sanitised as ZipFile.extract does"""
+    return [p for p in PurePosixPath(info.filename).parts if p not in ("/", ".", "..")]
+
+def _extract_member(zipf, info, target):
+    """Stream a single file member to target in RESTORE_CHUNK_BYTES blocks (its directory must exist)"""
+    partial = target.with_name(target.name + PARTIAL_SUFFIX)
+    with zipf.open(info) as src, open(partial, 'wb') as dst:
+        # Reserve large files up front so the filesystem can lay them out contiguously
+        if info.file_size >= RESTORE_CHUNK_BYTES and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(dst.fileno(), 0, info.file_size)
+            except OSError:
+                pass  # Not supported by this filesystem
+        _copy_stream(src, dst)
+    os.replace(partial, target)
+    return target
+
+def _copy_file_range(infd, outfd, offset):
+    return os.copy_file_range(infd, outfd, 1 << 30, offset, offset)
+
+def _sendfile(infd, outfd, offset):
+    return os.sendfile(outfd, infd, offset, 1 << 30)
+
+# In-kernel copy strategies, fastest first (copy_file_range can reflink on btrfs/xfs)
+_KERNEL_COPIES = [
+    strategy for strategy, name in ((_copy_file_range, 'copy_file_range'), (_sendfile, 'sendfile'))
+    if hasattr(os, name)
+]
+
+def fast_copy(src, dst):
+    """Copy a file without shuttling its bytes through Python where possible"""
+    if not _KERNEL_COPIES:
+        return shutil.copy2(src, dst)
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        offset = 0
+        for kernel_copy in _KERNEL_COPIES:
+            try:
+                os.lseek(outfd, offset, os.SEEK_SET)
+                while True:
+                    copied = kernel_copy(infd, outfd, offset)
+                    if not copied:
+                        break
+                    offset += copied
+                break
+            except OSError:
+                # EXDEV/ENOSYS/EINVAL: not supported here, try the next strategy
+                continue
+        else:
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            _copy_stream(fsrc, fdst)
+    
+    shutil.copystat(src, dst)
+    return dst
+
+def _atomic_copy(src, dst):
+    """fast_copy to a sibling partial file, then rename it over dst"""
+    partial = dst.with_name(dst.name + PARTIAL_SUFFIX)
+    fast_copy(src, partial)
+    os.replace(partial, dst)
+    return dst
+
+def _atomic_copytree(src, dst):
+    """copytree into a sibling partial directory, then rename it to dst"""
+    partial = dst.with_name(dst.name + PARTIAL_SUFFIX)
+    shutil.copytree(src, partial, copy_function=fast_copy)
+    os.rename(partial, dst)
+    return dst
+
+def _extract_shard(zip_path, members):
+    """Extract a subset of (info, target) pairs using a private ZipFile handle"""
+    # ZipFile handles are not safe to share between threads
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        for info, target in members:
+            _extract_member(zipf, info, target)
+
+def _extract_archive(zip_path, dest_dir, route=None):
+    """Extract a backup archive, inflating members on several threads once it is large enough; returns the file count
+    
+    route, when given, maps a member's path components to its components
+    under dest_dir, or returns None to skip the member.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        members = []
+        for info in zipf.infolist():
+            parts = _member_parts(info)
+            if parts and route:
+                parts = route(parts)
+            if parts:
+                members.append((info, Path(dest_dir).joinpath(*parts)))
+        
+        # Create every directory in one pass up front, so workers only ever write files
+        directories = {target if info.is_dir() else target.parent for info, target in members}
+        for directory in sorted(directories):
+            directory.mkdir(parents=True, exist_ok=True)
+        members = [member for member in members if not member[0].is_dir()]
+        if not members:
+            return 0
+        
+        # The SQLite database dominates the archive; inflate it on this thread
+        # while the workers handle the (many, small) embedding files
+        largest = max(members, key=lambda member: member[0].file_size)
+        others = [member for member in members if member is not largest]
+        # Workers spend much of their time blocked in writes, so allow two per core (up to 12)
+        workers = min(len(others), 2 * (os.cpu_count() or 1), 12)
+        
+        # Small archives inflate faster than a thread pool (and its extra ZipFile handles) starts up
+        if not workers or sum(info.compress_size for info, _ in members) < RESTORE_PARALLEL_MIN_BYTES:
+            for member in members:
+                _extract_member(zipf, *member)
+            return len(members)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_extract_shard, zip_path, others[i::workers])
+                for i in range(workers)
+            ]
+            _extract_member(zipf, *largest)
+            for future in futures:
+                future.result()
+    
+    return len(members)
+
+def _chroma_data_route(prefix):
+    """Route backup members straight to their chroma_data locations
+    
+    <prefix>/chroma.sqlite3 -> chroma.sqlite3
+    <prefix>/embeddings/<collection>/... -> <collection>/...
+    Everything else (JSON exports, manifests) is skipped.
+    """
+    prefix = list(prefix)
+    
+    def route(parts):
+        if parts[:len(prefix)] != prefix:
+            return None
+        relative = parts[len(prefix):]
+        if relative == ["chroma.sqlite3"]:
+            return relative
+        if len(relative) > 1 and relative[0] == "embeddings":
+            return relative[1:]
+        return None
+    
+    return route
+
+def safe_rmtree(path, retries=6, base_delay=0.25):
+    """shutil.rmtree, retried with exponential backoff while files are still held open"""
+    for attempt in range(retries):
+        try:
+            shutil.rmtree(path)
+            return
+        except OSError:
+            if not os.path.lexists(path):
+                return
+            if attempt == retries - 1:
+                raise
+            time.sleep(base_delay * 2 ** attempt)
+
+def dir_size(path):
+    """Total size in bytes of the regular files under path, walked with os.scandir"""
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+def collection_dirs(path):
+    """Collection directories directly under path, from a single scandir pass"""
+    with os.scandir(path) as it:
+        return [entry for entry in it
+                if entry.is_dir(follow_symlinks=False) and entry.name != "__pycache__"
+                and not entry.name.startswith(STALE_PREFIX)
+                and not entry.name.endswith(PARTIAL_SUFFIX)]
+
+def _backup_entries(backup_dir):
+    """chroma_backup_* entries of backup_dir as (DirEntry, mtime), newest first, from one scandir pass"""
+    with os.scandir(backup_dir) as it:
+        entries = [entry for entry in it if entry.name.startswith("chroma_backup_")]
+    return sorted(((entry, entry.stat().st_mtime) for entry in entries),
+                  key=lambda pair: pair[1], reverse=True)
+
+def _remove_trees(paths):
+    """safe_rmtree each path in turn (runs on the background deletion thread)"""
+    for path in paths:
+        safe_rmtree(path)
+
+def _sqlite_health(sqlite_file):
+    """Read-only PRAGMA quick_check plus a collections count; returns (problem, count)"""
+    conn = sqlite3.connect(f"{Path(sqlite_file).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if result != "ok":
+            return result, 0
+        return None, conn.execute("SELECT COUNT(*) FROM collections").fetchone()[0]
+    except sqlite3.DatabaseError as e:
+        return str(e), 0
+    finally:
+        conn.close()
 
 class ChromaDBRestore:
     def __init__(self):
@@ -27,14 +269,15 @@ class ChromaDBRestore:
             print("No backups found.")
             return []
         
+        # Newest first
         backups = []
-        for item in self.backup_dir.iterdir():
-            if item.is_dir() and item.name.startswith("chroma_backup_"):
+        for entry, mtime in _backup_entries(self.backup_dir):
+            if entry.is_dir():
                 backup_info = {
-                    "name": item.name,
-                    "path": item,
-                    "created": datetime.fromtimestamp(item.stat().st_mtime),
-                    "size_mb": sum(f.stat().st_size for f in item.rglob('*') if f.is_file()) / (1024 * 1024)
+                    "name": entry.name,
+                    "path": Path(entry.path),
+                    "created": datetime.fromtimestamp(mtime),
+                    "size_mb": dir_size(entry.path) / (1024 * 1024)
                 }
                 backups.append(backup_info)
         
@@ -42,9 +285,6 @@ class ChromaDBRestore:
             print("No backups found.")
             return []
         
-        # Sort by creation time (newest first)
-        backups.sort(key=lambda x: x["created"], reverse=True)
-        
         for i, backup in enumerate(backups):
             print(f"{i+1}. {backup['name']}")
             print(f"   Created: {backup['created'].strftime('%Y-%m-%d %H:%M:%S')}")
@@ -82,19 +322,16 @@ class ChromaDBRestore:
             print("❌ No backup directory found")
             return None
         
-        backups = []
-        for item in self.backup_dir.iterdir():
-            if (item.is_dir() and item.name.startswith("chroma_backup_")) or \
-               (item.is_file() and item.name.startswith("chroma_backup_") and item.suffix == '.zip'):
-                backups.append(item)
+        # Newest first
+        backups = [
+            Path(entry.path) for entry, _ in _backup_entries(self.backup_dir)
+            if entry.is_dir() or (entry.is_file() and entry.name.endswith('.zip'))
+        ]
         
         if not backups:
             print("❌ No backups found")
             return None
         
-        # Sort by creation time (newest first)
-        backups.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
         if backup_name:
             # Find by name
             for backup in backups:
@@ -116,6 +353,55 @@ class ChromaDBRestore:
             print(f"📦 Using most recent backup: {backups[0].name}")
             return backups[0]
     
+    def _begin_restore(self, manifest):
+        """Show backup info, confirm, and snapshot the current ChromaDB"""
+        print(f"📋 Backup info: {manifest['backup_info']['name']}")
+        print(f"📅 Created: {manifest['backup_info']['created_at']}")
+        
+        # Stop ChromaDB if running (optional)
+        print("⚠️  Please stop ChromaDB server if it's running")
+        input("Press Enter to continue...")
+        
+        # Leftovers from an interrupted restore must not be mistaken for collections
+        self._sweep_partial_copies()
+        
+        # Create backup of current ChromaDB
+        return self._create_current_backup()
+    
+    def _sweep_partial_copies(self):
+        """Remove half-written copies and undeleted stale directories left by an earlier restore"""
+        if not self.chroma_data_dir.exists():
+            return
+        
+        # Stale directories of this process are still being deleted by its own thread
+        own_stale = f"{STALE_PREFIX}{os.getpid()}-"
+        with os.scandir(self.chroma_data_dir) as it:
+            partials = [entry for entry in it
+                        if entry.name.endswith(PARTIAL_SUFFIX)
+                        or (entry.name.startswith(STALE_PREFIX) and not entry.name.startswith(own_stale))]
+        for entry in partials:
+            if entry.is_dir(follow_symlinks=False):
+                safe_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+            print(f"   🧹 Removed leftover: {entry.name}")
+    
+    def _remove_collection_dirs(self):
+        """Move existing embedding directories aside and delete them in the background"""
+        # A per-call token, not a timestamp: a rollback can move collections aside again
+        # within the same second, before the first batch has been deleted
+        tag = f"{STALE_PREFIX}{os.getpid()}-{uuid.uuid4().hex}-"
+        stale = []
+        for item in collection_dirs(self.chroma_data_dir):
+            stale_path = self.chroma_data_dir / (tag + item.name)
+            os.rename(item.path, stale_path)
+            stale.append(stale_path)
+            print(f"   🗑️  Removed existing collection: {item.name}")
+        
+        # Not a daemon: the interpreter waits for the deletion to finish before exiting
+        if stale:
+            threading.Thread(target=_remove_trees, args=(stale,), daemon=False).start()
+    
     def _restore_from_directory_backup(self, backup_path):
         """Restore from a directory backup"""
         print("📁 Restoring from directory backup...")
@@ -130,22 +416,14 @@ class ChromaDBRestore:
         with open(manifest_path, 'r') as f:
             manifest = json.load(f)
         
-        print(f"📋 Backup info: {manifest['backup_info']['name']}")
-        print(f"📅 Created: {manifest['backup_info']['created_at']}")
-        
-        # Stop ChromaDB if running (optional)
-        print("⚠️  Please stop ChromaDB server if it's running")
-        input("Press Enter to continue...")
-        
-        # Create backup of current ChromaDB
-        current_backup = self._create_current_backup()
+        current_backup = self._begin_restore(manifest)
         
         try:
             # Restore SQLite database
             sqlite_backup = backup_path / "chroma.sqlite3"
             if sqlite_backup.exists():
                 print("📊 Restoring SQLite database...")
-                shutil.copy2(sqlite_backup, self.chroma_data_dir / "chroma.sqlite3")
+                _atomic_copy(sqlite_backup, self.chroma_data_dir / "chroma.sqlite3")
                 print("   ✅ SQLite database restored")
             
             # Restore embedding files
@@ -154,17 +432,13 @@ class ChromaDBRestore:
                 print("🔍 Restoring embedding files...")
                 
                 # Remove existing embedding directories
-                for item in self.chroma_data_dir.iterdir():
-                    if item.is_dir() and item.name != "__pycache__":
-                        shutil.rmtree(item)
-                        print(f"   🗑️  Removed existing collection: {item.name}")
+                self._remove_collection_dirs()
                 
                 # Copy embedding directories
-                for collection_dir in embedding_backup.iterdir():
-                    if collection_dir.is_dir():
-                        dest_dir = self.chroma_data_dir / collection_dir.name
-                        shutil.copytree(collection_dir, dest_dir)
-                        print(f"   ✅ Restored collection: {collection_dir.name}")
+                for collection_dir in collection_dirs(embedding_backup):
+                    dest_dir = self.chroma_data_dir / collection_dir.name
+                    _atomic_copytree(collection_dir.path, dest_dir)
+                    print(f"   ✅ Restored collection: {collection_dir.name}")
             
             print("✅ Restore completed successfully!")
             print(f"💾 Previous version backed up to: {current_backup}")
@@ -172,42 +446,73 @@ class ChromaDBRestore:
             
         except Exception as e:
             print(f"❌ Restore failed: {e}")
-            print(f"🔄 Restoring previous version from: {current_backup}")
-            self._restore_from_directory_backup(current_backup)
+            self._rollback(current_backup)
             return False
     
     def _restore_from_compressed_backup(self, backup_path):
-        """Restore from a compressed backup"""
+        """Restore from a compressed backup, extracting straight into chroma_data"""
         print("🗜️  Restoring from compressed backup...")
         
-        # Extract to temporary directory
-        temp_extract_dir = self.project_root / f"temp_extract_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        temp_extract_dir.mkdir(exist_ok=True)
+        # Archives are written relative to the backup directory, but older ones
+        # may nest everything under a chroma_backup_*/ folder
+        with zipfile.ZipFile(backup_path, 'r') as zipf:
+            manifest_name = next(
+                (name for name in zipf.namelist() if PurePosixPath(name).name == "backup_manifest.json"),
+                None
+            )
+            if not manifest_name:
+                print("❌ No valid backup found in compressed file")
+                return False
+            manifest = json.loads(zipf.read(manifest_name))
+            prefix = PurePosixPath(manifest_name).parent.parts
+            embeddings_prefix = "/".join(prefix + ("embeddings", ""))
+            has_embeddings = any(name.startswith(embeddings_prefix) for name in zipf.namelist())
+        
+        current_backup = self._begin_restore(manifest)
         
         try:
-            print("📦 Extracting backup...")
-            with zipfile.ZipFile(backup_path, 'r') as zipf:
-                zipf.extractall(temp_extract_dir)
+            if has_embeddings:
+                print("🔍 Removing existing embedding files...")
+                self._remove_collection_dirs()
             
-            # Find the extracted backup directory
-            extracted_backups = [d for d in temp_extract_dir.iterdir() if d.is_dir() and d.name.startswith("chroma_backup_")]
-            if not extracted_backups:
-                print("❌ No valid backup found in compressed file")
-                return False
+            # Only the SQLite database and embedding files are written, each
+            # once, directly to their final location
+            print("📦 Extracting backup into chroma_data...")
+            self.chroma_data_dir.mkdir(exist_ok=True)
+            restored = _extract_archive(backup_path, self.chroma_data_dir, _chroma_data_route(prefix))
+            print(f"   ✅ Extracted {restored} files")
             
-            extracted_backup = extracted_backups[0]
-            print(f"📁 Extracted to: {extracted_backup}")
+            print("✅ Restore completed successfully!")
+            print(f"💾 Previous version backed up to: {current_backup}")
+            return True
             
-            # Restore from extracted directory
-            success = self._restore_from_directory_backup(extracted_backup)
+        except Exception as e:
+            print(f"❌ Restore failed: {e}")
+            self._rollback(current_backup)
+            return False
+    
+    def _rollback(self, current_backup):
+        """Put back the snapshot taken by _create_current_backup after a failed restore"""
+        if current_backup is None:
+            print("⚠️  No previous version to restore (chroma_data did not exist)")
+            return
+        
+        print(f"🔄 Restoring previous version from: {current_backup}")
+        try:
+            # Half-written copies from the failed restore would block the renames below
+            self._sweep_partial_copies()
             
-            return success
+            current_sqlite = current_backup / "chroma.sqlite3"
+            if current_sqlite.exists():
+                _atomic_copy(current_sqlite, self.chroma_data_dir / "chroma.sqlite3")
             
-        finally:
-            # Clean up temporary directory
-            if temp_extract_dir.exists():
-                shutil.rmtree(temp_extract_dir)
-                print("🧹 Cleaned up temporary files")
+            self._remove_collection_dirs()
+            for collection_dir in collection_dirs(current_backup / "embeddings"):
+                _atomic_copytree(collection_dir.path, self.chroma_data_dir / collection_dir.name)
+            print("   ✅ Previous version restored")
+        except Exception as e:
+            print(f"❌ Rollback failed: {e}")
+            print(f"   Copy {current_backup} back into {self.chroma_data_dir} manually")
     
     def _create_current_backup(self):
         """Create a backup of current ChromaDB before restore"""
@@ -222,16 +527,15 @@ class ChromaDBRestore:
             # Copy current SQLite database
             current_sqlite = self.chroma_data_dir / "chroma.sqlite3"
             if current_sqlite.exists():
-                shutil.copy2(current_sqlite, current_backup_path / "chroma.sqlite3")
+                fast_copy(current_sqlite, current_backup_path / "chroma.sqlite3")
             
             # Copy current embedding files
             current_embeddings = current_backup_path / "embeddings"
             current_embeddings.mkdir(exist_ok=True)
             
-            for item in self.chroma_data_dir.iterdir():
-                if item.is_dir() and item.name != "__pycache__":
-                    dest_dir = current_embeddings / item.name
-                    shutil.copytree(item, dest_dir)
+            for item in collection_dirs(self.chroma_data_dir):
+                dest_dir = current_embeddings / item.name
+                shutil.copytree(item.path, dest_dir, copy_function=fast_copy)
             
             print(f"   ✅ Current version backed up to: {current_backup_path}")
             return current_backup_path
@@ -249,14 +553,21 @@ class ChromaDBRestore:
                 print("❌ SQLite database not found")
                 return False
             
+            # Check the database itself before any client maps it
+            problem, collection_count = _sqlite_health(sqlite_file)
+            if problem:
+                print(f"❌ SQLite database failed integrity check: {problem}")
+                return False
+            
             # Check for embedding collections
-            embedding_collections = [d for d in self.chroma_data_dir.iterdir() if d.is_dir() and d.name != "__pycache__"]
+            embedding_collections = collection_dirs(self.chroma_data_dir)
             if not embedding_collections:
                 print("❌ No embedding collections found")
                 return False
             
             print(f"✅ Restore verification passed")
             print(f"   📊 SQLite database: {sqlite_file.stat().st_size / (1024 * 1024):.2f} MB")
+            print(f"   📚 Collections in database: {collection_count}")
             print(f"   🔍 Embedding collections: {len(embedding_collections)}")
             
             return True
@@ -264,6 +575,34 @@ class ChromaDBRestore:
         except Exception as e:
             print(f"❌ Verification failed: {e}")
             return False
+    
+    def warmup_page_cache(self):
+        """Read the restored files once so the first query does not pay for a cold disk"""
+        print("🔥 Warming page cache...")
+        
+        # Only the live database and collections; stale directories are still being deleted
+        paths = [self.chroma_data_dir / "chroma.sqlite3"]
+        for collection_dir in collection_dirs(self.chroma_data_dir):
+            for root, _, files in os.walk(collection_dir.path):
+                paths.extend(os.path.join(root, name) for name in files)
+        
+        buffer = _copy_buffer()
+        warmed_bytes = 0
+        for path in paths:
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            with f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    warmed_bytes += read
+        
+        print(f"   ✅ Warmed {warmed_bytes / (1024 * 1024):.2f} MB")
 
 def main():
     """Main function to run the restore"""
@@ -305,6 +644,8 @@ def main():
             print("🔍 Verifying restore...")
             if restore.verify_restore():
                 print("✅ Restore verification passed!")
+                if os.environ.get("WARMUP_AFTER_RESTORE") == "1":
+                    restore.warmup_page_cache()
                 print("🚀 You can now start ChromaDB and your chatbot")
             else:
                 print("⚠️  Restore verification failed - check the logs")
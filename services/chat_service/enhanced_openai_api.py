@@ -14,6 +14,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import time
+import traceback
 import uuid
 import os
 import sys
@@ -211,7 +212,6 @@ async def chat(request: ChatRequest):
     except Exception as e:
         # Log full error for debugging (server-side only)
         print(f"[ENHANCED OPENAI API] Error in chat endpoint: {e}")
-        import traceback
         traceback.print_exc()
         # Return generic error message to client (don't leak system details)
         raise HTTPException(
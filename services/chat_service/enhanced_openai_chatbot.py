@@ -23,6 +23,7 @@ import numpy as np
 from datetime import datetime
 import hashlib
 import time
+import traceback
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -416,7 +417,6 @@ Detailed Answer:"""
             
         except Exception as e:
             print(f"[ENHANCED OPENAI] Query expansion error: {e}")
-            import traceback
             traceback.print_exc()
             return [query]
     
@@ -823,7 +823,6 @@ Provide a detailed, well-structured answer about Northeastern University program
             
         except Exception as e:
             print(f"[ENHANCED OPENAI] Error generating response: {e}")
-            import traceback
             traceback.print_exc()
             return {
                 'answer': f"I'm sorry, I encountered an error: {str(e)}. Please try again.",
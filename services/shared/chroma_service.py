@@ -443,8 +443,7 @@ class ChromaService:
         """Get count of items in a collection - optimized for single collection setup"""
         try:
             collection = get_collection(collection_name, create_if_not_exists=False)
-            result = collection.get()
-            count = len(result['ids']) if result['ids'] else 0
+            count = collection.count()
             
             if collection_name == 'documents':
                 print(f"[CHROMA SERVICE] documents_unified collection contains {count} documents")
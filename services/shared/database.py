@@ -16,6 +16,7 @@ print(f"Python path: {sys.path[:3]}")
 try:
     import chromadb
     from chromadb.config import Settings
+    import chromadb.errors
     print("[OK] ChromaDB imported successfully")
 except ImportError as e:
     print(f"[ERROR] ChromaDB import error: {e}")
@@ -40,6 +41,15 @@ except ImportError as e:
 # Global ChromaDB client
 chroma_client = None
 
+# What get_collection raises for a missing collection: NotFoundError in chromadb 1.x,
+# InvalidCollectionException in 0.6, ValueError before that. Anything else (e.g. a
+# schema mismatch surfacing as sqlite3.OperationalError) is a real error.
+COLLECTION_NOT_FOUND_ERRORS = (ValueError,) + tuple(
+    getattr(chromadb.errors, name)
+    for name in ("NotFoundError", "InvalidCollectionException")
+    if hasattr(chromadb.errors, name)
+)
+
 def get_database_type():
     """Get the current database type (for backward compatibility)"""
     use_cloud = os.getenv('USE_CLOUD_CHROMA', 'false').lower() == 'true'
@@ -85,7 +95,7 @@ def get_collection(name: str, create_if_not_exists: bool = True) -> chromadb.Col
         collection = client.get_collection(name=name)
         print(f"[OK] Retrieved collection: {name}")
         return collection
-    except Exception as e:
+    except COLLECTION_NOT_FOUND_ERRORS:
         if create_if_not_exists:
             print(f"[INFO] Collection {name} not found, creating...")
             collection = client.create_collection(name=name)
@@ -114,7 +124,7 @@ def init_db():
             try:
                 collection = client.get_collection(name=collection_name)
                 print(f"[OK] Collection exists: {collection_name}")
-            except:
+            except COLLECTION_NOT_FOUND_ERRORS:
                 collection = client.create_collection(name=collection_name)
                 print(f"[OK] Created collection: {collection_name}")
         
@@ -198,7 +208,7 @@ if __name__ == "__main__":
                 col = client.get_collection(name=name)
                 # Try to count documents (if API supports it)
                 try:
-                    count = len(col.get()['ids'])
+                    count = col.count()
                 except Exception:
                     count = 'unknown'
                 print(f"  - {name}: {count} documents")
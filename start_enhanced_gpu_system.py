@@ -4,19 +4,44 @@ Enhanced GPU Chatbot System Startup Script
 Launches the enhanced GPU chatbot API and frontend server
 """
 
+import asyncio
 import subprocess
 import sys
 import os
 import time
 import signal
 import threading
+import urllib.error
+import urllib.request
+from collections import deque
 from pathlib import Path
 
+# How long to wait for a launched server to answer HTTP before carrying on without it
+READY_DEADLINE = float(os.environ.get("READY_DEADLINE", "60"))
+
+# Lines of each server's output kept for diagnosing a failed start
+OUTPUT_TAIL_LINES = 200
+
+def _probe(url):
+    """Return True once url answers with a non-5xx status"""
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as e:
+        return e.code < 500
+    except OSError:
+        return False
+
 class EnhancedGPUSystem:
     def __init__(self):
         self.api_process = None
         self.frontend_process = None
         self.running = False
+        self.output = {}
+        self.drain_threads = {}
+        self.echo_output = threading.Event()
+        # Serializes buffering/echoing with the flush in monitor_processes
+        self.output_lock = threading.Lock()
         
         # Get project root directory
         self.project_root = Path(__file__).parent.absolute()
@@ -79,17 +104,8 @@ class EnhancedGPUSystem:
                 universal_newlines=True,
                 bufsize=1
             )
-            
-            # Wait a moment for the server to start
-            time.sleep(3)
-            
-            if self.api_process.poll() is None:
-                print("✅ Enhanced GPU API Server started successfully")
-                print(f"🌐 API URL: http://localhost:8001")
-                return True
-            else:
-                print("❌ Failed to start Enhanced GPU API Server")
-                return False
+            self._capture_output("API", self.api_process)
+            return True
                 
         except Exception as e:
             print(f"❌ Error starting API server: {e}")
@@ -116,48 +132,94 @@ class EnhancedGPUSystem:
                 universal_newlines=True,
                 bufsize=1
             )
-            
-            # Wait a moment for the server to start
-            time.sleep(5)
-            
-            if self.frontend_process.poll() is None:
-                print("✅ Frontend Server started successfully")
-                print(f"📋 Frontend URL: http://localhost:3000")
-                return True
-            else:
-                # Check if there was an error
-                stdout, stderr = self.frontend_process.communicate()
-                if stdout:
-                    print(f"Frontend server output: {stdout}")
-                if stderr:
-                    print(f"Frontend server error: {stderr}")
-                print("❌ Failed to start Frontend Server")
-                return False
+            self._capture_output("Frontend", self.frontend_process)
+            return True
                 
         except Exception as e:
             print(f"❌ Error starting frontend server: {e}")
             return False
     
-    def monitor_processes(self):
-        """Monitor running processes and display output"""
-        def monitor_api():
-            if self.api_process:
-                for line in iter(self.api_process.stdout.readline, ''):
-                    if line:
-                        print(f"[API] {line.rstrip()}")
+    def _capture_output(self, name, process):
+        """Drain a server's output into a bounded buffer, echoing it once startup is done"""
+        tail = self.output[name] = deque(maxlen=OUTPUT_TAIL_LINES)
         
-        def monitor_frontend():
-            if self.frontend_process:
-                for line in iter(self.frontend_process.stdout.readline, ''):
-                    if line:
-                        print(f"[Frontend] {line.rstrip()}")
+        def drain():
+            for line in iter(process.stdout.readline, ''):
+                line = line.rstrip()
+                with self.output_lock:
+                    tail.append(line)
+                    if self.echo_output.is_set():
+                        print(f"[{name}] {line}")
         
-        # Start monitoring threads
-        api_thread = threading.Thread(target=monitor_api, daemon=True)
-        frontend_thread = threading.Thread(target=monitor_frontend, daemon=True)
+        thread = threading.Thread(target=drain, daemon=True)
+        thread.start()
+        self.drain_threads[name] = thread
+    
+    def _dump_output(self, name):
+        """Print the buffered tail of a server's output"""
+        # Let the reader catch up with whatever an exited server wrote last
+        self.drain_threads[name].join(timeout=1)
+        tail = self.output.get(name)
+        if tail:
+            print(f"📋 Last {len(tail)} lines from {name}:")
+            for line in list(tail):
+                print(f"   {line}")
+    
+    async def _wait_ready(self, process, url, deadline=READY_DEADLINE):
+        """Poll url with exponential backoff until it answers, the process exits, or the deadline passes"""
+        start = time.monotonic()
+        delay = 0.1
+        while time.monotonic() - start < deadline:
+            if process.poll() is not None:
+                return False
+            if await asyncio.to_thread(_probe, url):
+                return True
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+        return False
+    
+    async def wait_for_servers(self):
+        """Wait for the API and frontend servers concurrently rather than one after another"""
+        api_ok, frontend_ok = await asyncio.gather(
+            self._wait_ready(self.api_process, "http://localhost:8001/health"),
+            self._wait_ready(self.frontend_process, "http://localhost:3000/"),
+        )
+        
+        # Only a server that exited has failed; one still loading its models past the
+        # deadline is left running and reported, since its output is echoed from here on
+        if api_ok:
+            print("✅ Enhanced GPU API Server started successfully")
+            print(f"🌐 API URL: http://localhost:8001")
+        elif self.api_process.poll() is None:
+            print(f"⚠️  Enhanced GPU API Server still starting after {READY_DEADLINE:.0f}s, continuing")
+            print(f"🌐 API URL (once ready): http://localhost:8001")
+            api_ok = True
+        else:
+            print("❌ Failed to start Enhanced GPU API Server")
+            self._dump_output("API")
+        
+        if frontend_ok:
+            print("✅ Frontend Server started successfully")
+            print(f"📋 Frontend URL: http://localhost:3000")
+        elif self.frontend_process.poll() is None:
+            print(f"⚠️  Frontend Server still starting after {READY_DEADLINE:.0f}s, continuing")
+            print(f"📋 Frontend URL (once ready): http://localhost:3000")
+            frontend_ok = True
+        else:
+            print("❌ Failed to start Frontend Server")
+            self._dump_output("Frontend")
         
-        api_thread.start()
-        frontend_thread.start()
+        return api_ok and frontend_ok
+    
+    def monitor_processes(self):
+        """Monitor running processes and display output"""
+        # The capture threads have been draining output since launch; print what they
+        # buffered during startup, then echo new lines as they arrive
+        with self.output_lock:
+            for name, tail in self.output.items():
+                for line in tail:
+                    print(f"[{name}] {line}")
+            self.echo_output.set()
     
     def stop_servers(self):
         """Stop all running servers"""
@@ -219,6 +281,11 @@ class EnhancedGPUSystem:
             self.stop_servers()
             return False
         
+        # Wait for both servers together
+        if not asyncio.run(self.wait_for_servers()):
+            self.stop_servers()
+            return False
+        
         # Start monitoring
         self.monitor_processes()
         
@@ -9,13 +9,15 @@ from pathlib import Path
 
 def print_banner():
     """Print startup banner"""
-    print("=" * 60)
-    print("🚀 Northeastern University Chatbot - Hybrid Mode")
-    print("=" * 60)
-    print("✅ Trying Full API First")
-    print("✅ Fallback to Minimal Mode")
-    print("✅ Robust Error Handling")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "🚀 Northeastern University Chatbot - Hybrid Mode",
+        "=" * 60,
+        "✅ Trying Full API First",
+        "✅ Fallback to Minimal Mode",
+        "✅ Robust Error Handling",
+        "=" * 60,
+    ]))
 
 def create_minimal_app():
     """Create a minimal FastAPI app as fallback"""
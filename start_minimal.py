@@ -10,13 +10,15 @@ from pathlib import Path
 
 def print_banner():
     """Print startup banner"""
-    print("=" * 60)
-    print("🚀 Northeastern University Chatbot - Minimal Mode")
-    print("=" * 60)
-    print("✅ Simple FastAPI Server")
-    print("✅ Basic Health Check")
-    print("✅ Fallback Mode")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "🚀 Northeastern University Chatbot - Minimal Mode",
+        "=" * 60,
+        "✅ Simple FastAPI Server",
+        "✅ Basic Health Check",
+        "✅ Fallback Mode",
+        "=" * 60,
+    ]))
 
 def create_simple_app():
     """Create a simple FastAPI app"""
@@ -12,14 +12,16 @@ from pathlib import Path
 
 def print_banner():
     """Print startup banner"""
-    print("=" * 60)
-    print("🚀 Northeastern University Chatbot - Production Mode")
-    print("=" * 60)
-    print("✅ Using Fixed ChatGPT Integration")
-    print("✅ Enhanced URL Handling")
-    print("✅ Fallback Database Support")
-    print("✅ Robust Health Check System")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "🚀 Northeastern University Chatbot - Production Mode",
+        "=" * 60,
+        "✅ Using Fixed ChatGPT Integration",
+        "✅ Enhanced URL Handling",
+        "✅ Fallback Database Support",
+        "✅ Robust Health Check System",
+        "=" * 60,
+    ]))
 
 def create_basic_env():
     """Create a basic .env file for production"""
@@ -48,6 +48,11 @@ def check_environment():
 
 def create_basic_env():
     """Create basic .env file"""
+    # Railway injects real keys as environment variables; a placeholder file would only add noise
+    if any(key in os.environ for key in ("OPENAI_API_KEY", "PINECONE_API_KEY")):
+        log("✅ API keys provided by the environment, skipping .env file")
+        return
+    
     env_file = Path(".env")
     if not env_file.exists():
         log("⚠️  Creating basic .env file...")
@@ -67,53 +72,8 @@ def create_simple_app():
     try:
         log("🌐 Creating simple FastAPI app...")
         
-        from fastapi import FastAPI
-        from fastapi.middleware.cors import CORSMiddleware
-        
-        app = FastAPI(
-            title="Northeastern University Chatbot - Railway Mode",
-            description="Simple chatbot API for Railway deployment",
-            version="1.0.0"
-        )
-        
-        # Add CORS middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-        
-        @app.get("/health")
-        async def health():
-            """Health check endpoint"""
-            return {"status": "healthy", "message": "Railway API is running"}
-        
-        @app.get("/")
-        async def root():
-            """Root endpoint"""
-            return {
-                "message": "Northeastern University Chatbot - Railway Mode",
-                "status": "running",
-                "environment": "railway",
-                "endpoints": {
-                    "health": "/health",
-                    "chat": "/chat"
-                }
-            }
-        
-        @app.post("/chat")
-        async def chat():
-            """Simple chat endpoint"""
-            return {
-                "answer": "Hello! I'm the Northeastern University Chatbot running on Railway. The full chatbot is being initialized.",
-                "sources": [],
-                "confidence": 0.8,
-                "session_id": "railway_mode",
-                "response_time": 0.1,
-                "documents_analyzed": 0
-            }
+        from services.chat_service.minimal_api import build_app
+        app = build_app("railway")
         
         log("✅ FastAPI app created successfully")
         return app
@@ -145,8 +105,8 @@ def start_server(app):
             app,
             host=host,
             port=port,
-            log_level="info",
-            access_log=True
+            log_level=os.environ.get("LOG_LEVEL", "info"),
+            access_log=os.environ.get("ACCESS_LOG") == "1"  # Per-request logging is opt-in
         )
         
     except Exception as e:
@@ -9,65 +9,21 @@ from pathlib import Path
 
 def print_banner():
     """Print startup banner"""
-    print("=" * 60)
-    print("🚀 Northeastern University Chatbot - Ultra Minimal Mode")
-    print("=" * 60)
-    print("✅ Guaranteed to work")
-    print("✅ No complex imports")
-    print("✅ Simple FastAPI server")
-    print("=" * 60)
+    print("\n".join([
+        "=" * 60,
+        "🚀 Northeastern University Chatbot - Ultra Minimal Mode",
+        "=" * 60,
+        "✅ Guaranteed to work",
+        "✅ No complex imports",
+        "✅ Simple FastAPI server",
+        "=" * 60,
+    ]))
 
 def create_ultra_minimal_app():
     """Create an ultra minimal FastAPI app"""
     try:
-        from fastapi import FastAPI
-        from fastapi.middleware.cors import CORSMiddleware
-        
-        app = FastAPI(
-            title="Northeastern University Chatbot - Ultra Minimal",
-            description="Ultra simple chatbot API",
-            version="1.0.0"
-        )
-        
-        # Add CORS middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-        
-        @app.get("/health")
-        async def health():
-            """Ultra simple health check"""
-            return {"status": "healthy", "message": "Ultra minimal API is running"}
-        
-        @app.get("/")
-        async def root():
-            """Root endpoint"""
-            return {
-                "message": "Northeastern University Chatbot - Ultra Minimal Mode",
-                "status": "running",
-                "mode": "ultra_minimal",
-                "endpoints": {
-                    "health": "/health",
-                    "chat": "/chat"
-                }
-            }
-        
-        @app.post("/chat")
-        async def chat():
-            """Ultra simple chat endpoint"""
-            return {
-                "answer": "Hello! I'm the Northeastern University Chatbot in ultra minimal mode. The full chatbot is being initialized.",
-                "sources": [],
-                "confidence": 0.8,
-                "session_id": "ultra_minimal_mode",
-                "response_time": 0.1,
-                "documents_analyzed": 0
-            }
-        
+        from services.chat_service.minimal_api import build_app
+        app = build_app("ultra_minimal")
         return app
         
     except ImportError as e:
@@ -98,8 +54,8 @@ def start_server():
             app,
             host="0.0.0.0",
             port=8001,
-            log_level="info",
-            access_log=True
+            log_level=os.environ.get("LOG_LEVEL", "info"),
+            access_log=os.environ.get("ACCESS_LOG") == "1"  # Per-request logging is opt-in
         )
         
     except Exception as e:
@@ -114,12 +70,16 @@ def main():
     print(f"🔍 Current directory: {os.getcwd()}")
     print(f"🔍 Python path: {sys.path}")
     
-    # Create basic .env if it doesn't exist
-    if not Path(".env").exists():
+    # Create basic .env if it doesn't exist and no key was injected (same check as the other launchers)
+    injected = any(key in os.environ for key in ("OPENAI_API_KEY", "PINECONE_API_KEY"))
+    if not injected and not Path(".env").exists():
         print("⚠️  Creating basic .env file...")
-        with open(".env", "w") as f:
-            f.write("OPENAI_API_KEY=your_openai_api_key_here\n")
-        print("✅ Created basic .env file")
+        try:
+            with open(".env", "w") as f:
+                f.write("OPENAI_API_KEY=your_openai_api_key_here\n")
+            print("✅ Created basic .env file")
+        except OSError as e:
+            print(f"⚠️  Could not create .env file: {e}")
     
     print("✅ Environment check passed")
     
@@ -1,36 +1,67 @@
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any
+import os
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 import chromadb
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 router = APIRouter()
 
-class DocumentUpload(BaseModel):
-    documents: List[str]
-    metadatas: List[Dict[str, Any]]
-    ids: List[str]
+# Cap how many documents ChromaDB embeds and writes per add() call
+UPLOAD_BATCH_SIZE = int(os.environ.get("UPLOAD_BATCH_SIZE", "256"))
 
-@router.post("/upload-documents")
-async def upload_documents(data: DocumentUpload):
+# Metadata value types ChromaDB accepts
+METADATA_TYPES = (str, int, float, bool, type(None))
+
+def _add_documents(documents, metadatas, ids):
+    from services.shared.database import get_chroma_client, get_collection
+    
+    # Get or create documents collection
     try:
-        from services.shared.database import get_chroma_client, get_collection
-        
-        # Get or create documents collection
+        collection = get_collection('documents')
+    except:
+        client = get_chroma_client()
+        collection = client.create_collection(name="documents")
+    
+    # Add documents in bounded batches; earlier batches stay written if a later one fails
+    for i in range(0, len(ids), UPLOAD_BATCH_SIZE):
         try:
-            collection = get_collection('documents')
-        except:
-            client = get_chroma_client()
-            collection = client.create_collection(name="documents")
-        
-        # Add documents
-        collection.add(
-            documents=data.documents,
-            metadatas=data.metadatas,
-            ids=data.ids
-        )
+            collection.add(
+                documents=documents[i:i + UPLOAD_BATCH_SIZE],
+                metadatas=metadatas[i:i + UPLOAD_BATCH_SIZE],
+                ids=ids[i:i + UPLOAD_BATCH_SIZE]
+            )
+        except Exception as e:
+            raise RuntimeError(f"{e} ({i} of {len(ids)} documents were uploaded before the failure)") from e
+
+@router.post("/upload-documents")
+async def upload_documents(request: Request):
+    # Plain type checks instead of a per-element Pydantic model pass over bulk payloads
+    try:
+        data = json_loads(await request.body())
+        documents, metadatas, ids = data["documents"], data["metadatas"], data["ids"]
+        if not all(isinstance(values, list) for values in (documents, metadatas, ids)):
+            raise TypeError("documents, metadatas and ids must be lists")
+        if not len(documents) == len(metadatas) == len(ids):
+            raise ValueError("documents, metadatas and ids must have the same length")
+        # ChromaDB only checks a batch when it is added, so check every element before the first write
+        if not all(isinstance(value, str) for values in (documents, ids) for value in values):
+            raise TypeError("documents and ids must be strings")
+        if not all(isinstance(metadata, dict) and all(isinstance(value, METADATA_TYPES) for value in metadata.values())
+                   for metadata in metadatas):
+            raise TypeError("metadatas must be objects with string, number, boolean or null values")
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid upload payload: {e}")
+    
+    try:
+        # ChromaDB calls block, so keep them off the event loop
+        await run_in_threadpool(_add_documents, documents, metadatas, ids)
         
-        return {"status": "success", "uploaded": len(data.ids)}
+        return {"status": "success", "uploaded": len(ids)}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
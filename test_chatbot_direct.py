@@ -6,15 +6,16 @@ Direct test of the fixed chatbot without API
 import sys
 import os
 
-# Add services to path
-sys.path.append('services/chat_service')
+# Import through the package path used everywhere else, so a test run that also
+# imports it elsewhere shares one loaded chatbot instead of initializing a second copy
+sys.path.append('.')
 
 def test_chatbot():
     print("🧪 Testing Fixed Chatbot Directly")
     print("=" * 40)
     
     try:
-        from fixed_chatbot import chatbot
+        from services.chat_service.fixed_chatbot import chatbot
         
         print("✅ Chatbot imported successfully")
         print(f"📊 Database type: {chatbot.db_type}")
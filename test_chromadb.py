@@ -4,32 +4,59 @@ Simple test script to verify ChromaDB status after restore
 """
 
 import os
+import sqlite3
 import sys
+from pathlib import Path
+
+def _collection_counts(sqlite_file):
+    """(name, count) per collection read from chroma.sqlite3, without building embedding functions"""
+    # Relies on ChromaDB's internal collections/segments/embeddings tables, which are not a
+    # public API; callers fall back to the client when the schema no longer matches
+    conn = sqlite3.connect(f"{Path(sqlite_file).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return conn.execute(
+            "SELECT c.name, COUNT(e.id) FROM collections c "
+            "LEFT JOIN segments s ON s.collection = c.id "
+            "LEFT JOIN embeddings e ON e.segment_id = s.id "
+            "GROUP BY c.id ORDER BY c.name"
+        ).fetchall()
+    finally:
+        conn.close()
+
+def _client_collection_counts(client):
+    """(name, count) per collection through the public client API"""
+    # list_collections() returns names in chromadb 0.6 and Collection objects in 1.x
+    names = sorted(c if isinstance(c, str) else c.name for c in client.list_collections())
+    return [(name, client.get_collection(name).count()) for name in names]
 
 def test_chromadb():
     try:
         print("🔍 Testing ChromaDB Status...")
         print("=" * 50)
         
-        # Check if chroma_data directory exists
-        if os.path.exists('chroma_data'):
+        # One directory scan answers existence, contents and entry types together
+        try:
+            with os.scandir('chroma_data') as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = None
+        
+        if entries is not None:
             print("✅ chroma_data directory exists")
-            
-            # List contents
-            contents = os.listdir('chroma_data')
-            print(f"📁 Contents: {contents}")
+            print(f"📁 Contents: {list(entries)}")
             
             # Check for key files
-            if 'chroma.sqlite3' in contents:
+            if 'chroma.sqlite3' in entries:
                 print("✅ chroma.sqlite3 found")
             else:
                 print("❌ chroma.sqlite3 not found")
                 
-            if 'embeddings' in contents:
+            if 'embeddings' in entries:
                 print("✅ embeddings directory found")
-                embeddings_dir = os.path.join('chroma_data', 'embeddings')
-                if os.path.isdir(embeddings_dir):
-                    embedding_collections = os.listdir(embeddings_dir)
+                embeddings_dir = entries['embeddings']
+                if embeddings_dir.is_dir():
+                    with os.scandir(embeddings_dir.path) as it:
+                        embedding_collections = [entry.name for entry in it]
                     print(f"📊 Embedding collections: {len(embedding_collections)}")
                     for collection in embedding_collections:
                         print(f"   - {collection}")
@@ -45,15 +72,19 @@ def test_chromadb():
             print("✅ ChromaDB imported successfully")
             
             client = chromadb.PersistentClient(path='chroma_data')
-            collections = client.list_collections()
-            print(f"📚 Collections found: {len(collections)}")
+            # list_collections() would build an embedding function for every collection
+            collection_count = client.count_collections()
+            print(f"📚 Collections found: {collection_count}")
             
-            for collection in collections:
-                try:
-                    count = collection.count()
-                    print(f"   - {collection.name}: {count} documents")
-                except Exception as e:
-                    print(f"   - {collection.name}: Error getting count - {e}")
+            try:
+                counts = _collection_counts(os.path.join('chroma_data', 'chroma.sqlite3'))
+            except sqlite3.Error as e:
+                print(f"   ⚠️  Could not read collection counts from sqlite ({e}), asking the client")
+                counts = None
+            if counts is None or len(counts) != collection_count:
+                counts = _client_collection_counts(client)
+            for name, count in counts:
+                print(f"   - {name}: {count} documents")
                     
         except ImportError as e:
             print(f"❌ Failed to import ChromaDB: {e}")
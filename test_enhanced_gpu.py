@@ -3,6 +3,7 @@
 Test script for Enhanced GPU Chatbot System
 """
 
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -16,9 +17,11 @@ def test_imports():
     
     try:
         print("  - Testing basic imports...")
-        import fastapi
-        import uvicorn
-        import langchain
+        # Availability is all this step checks; the chatbot and API imports below load what they use
+        missing = [name for name in ("fastapi", "uvicorn", "langchain")
+                   if importlib.util.find_spec(name) is None]
+        if missing:
+            raise ImportError(f"missing packages: {', '.join(missing)}")
         print("  ✅ Basic imports successful")
         
         print("  - Testing enhanced GPU chatbot...")
@@ -40,8 +43,14 @@ def test_chatbot_initialization():
     print("\n🤖 Testing chatbot initialization...")
     
     try:
-        from services.chat_service.enhanced_gpu_chatbot import EnhancedGPUUniversityRAGChatbot
-        chatbot = EnhancedGPUUniversityRAGChatbot()
+        # Importing the API (done by test_imports) already built a chatbot; loading the
+        # embedding model a second time would only repeat that work
+        api = sys.modules.get("services.chat_service.enhanced_gpu_api")
+        if api is not None:
+            chatbot = api.enhanced_gpu_chatbot
+        else:
+            from services.chat_service.enhanced_gpu_chatbot import EnhancedGPUUniversityRAGChatbot
+            chatbot = EnhancedGPUUniversityRAGChatbot()
         print("  ✅ Enhanced GPU chatbot initialized successfully")
         print(f"  📱 Device: {chatbot.embedding_manager.device}")
         return True
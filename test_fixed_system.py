@@ -3,18 +3,22 @@
 Test the Fixed Northeastern University Chatbot System
 """
 
-import sys
+import json
 import os
-import time
 import requests
 from pathlib import Path
 
+from api_check_session import SESSION, response_json
+
+# The chat check always sends the same question; encode it once
+CHAT_PAYLOAD = json.dumps({"question": "Tell me about Northeastern University admissions"}).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 def test_chatbot_import():
     """Test if the fixed chatbot can be imported"""
     print("🔍 Testing chatbot import...")
     try:
-        sys.path.append('services/chat_service')
-        from fixed_chatbot import chatbot
+        from services.chat_service.fixed_chatbot import chatbot
         print("✅ Fixed chatbot imported successfully")
         return True
     except Exception as e:
@@ -25,8 +29,7 @@ def test_chatbot_functionality():
     """Test basic chatbot functionality"""
     print("🔍 Testing chatbot functionality...")
     try:
-        sys.path.append('services/chat_service')
-        from fixed_chatbot import chatbot
+        from services.chat_service.fixed_chatbot import chatbot
         
         # Test a simple question
         result = chatbot.chat("Tell me about Northeastern University admissions", "test_session")
@@ -49,10 +52,10 @@ def test_api_server():
     """Test if the API server is running"""
     print("🔍 Testing API server...")
     try:
-        response = requests.get("http://localhost:8001/", timeout=5)
-        if response.status_code == 200:
+        response = SESSION.get("http://localhost:8001/", timeout=5)
+        if response.ok:
             print("✅ API server is running")
-            data = response.json()
+            data = response_json(response)
             print(f"📊 Status: {data.get('status', 'unknown')}")
             print(f"📄 Document count: {data.get('document_count', 'unknown')}")
             return True
@@ -70,14 +73,15 @@ def test_chat_endpoint():
     """Test the chat endpoint"""
     print("🔍 Testing chat endpoint...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8001/chat",
-            json={"question": "Tell me about Northeastern University admissions"},
+            data=CHAT_PAYLOAD,
+            headers=JSON_HEADERS,
             timeout=10
         )
         
-        if response.status_code == 200:
-            data = response.json()
+        if response.ok:
+            data = response_json(response)
             print("✅ Chat endpoint test passed")
             print(f"📝 Answer: {data.get('answer', '')[:100]}...")
             print(f"📊 Sources: {len(data.get('sources', []))}")
@@ -123,7 +127,6 @@ def main():
         print("-" * 40)
         result = test_func()
         results.append((test_name, result))
-        time.sleep(1)
     
     print("\n📊 Test Results Summary")
     print("=" * 60)
@@ -7,19 +7,22 @@ import requests
 import time
 import sys
 
+from api_check_session import SESSION, response_json
+
 def test_health_endpoint():
     """Test the health endpoint"""
     print("🔍 Testing health endpoint...")
     
     try:
         # Test local endpoint
-        response = requests.get("http://localhost:8001/health", timeout=10)
+        response = SESSION.get("http://localhost:8001/health", timeout=10)
         
-        if response.status_code == 200:
+        if response.ok:
+            data = response_json(response)
             print("✅ Health endpoint working!")
-            print(f"   Status: {response.json().get('status', 'unknown')}")
-            print(f"   Message: {response.json().get('message', 'no message')}")
-            print(f"   Database: {response.json().get('database_type', 'unknown')}")
+            print(f"   Status: {data.get('status', 'unknown')}")
+            print(f"   Message: {data.get('message', 'no message')}")
+            print(f"   Database: {data.get('database_type', 'unknown')}")
             return True
         else:
             print(f"❌ Health endpoint failed: {response.status_code}")
@@ -39,9 +42,9 @@ def test_root_endpoint():
     print("🔍 Testing root endpoint...")
     
     try:
-        response = requests.get("http://localhost:8001/", timeout=10)
+        response = SESSION.get("http://localhost:8001/", timeout=10)
         
-        if response.status_code == 200:
+        if response.ok:
             print("✅ Root endpoint working!")
             return True
         else: